@@ -1,30 +1,150 @@
-"""Resume tailoring application using OpenAI API and Google Docs."""
+"""Resume tailoring application using OpenAI API and Google Docs.
 
-from openai import OpenAI
+The OpenAI and Google client libraries are imported where they are first
+used, so the interactive prompts appear without waiting on those imports.
+"""
+
+import argparse
+import asyncio
+import codecs
+import concurrent.futures
+import functools
+import glob
+import json
+import math
 import os
 import re
-import pickle
+import sys
+import textwrap
+import time
 from dotenv import load_dotenv
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build, Resource
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional, TYPE_CHECKING
 import logging
+from semantic_cache import ExactCache, SemanticCache
+
+if TYPE_CHECKING:
+    from googleapiclient.discovery import Resource
 
 # Load environment variables
 load_dotenv()
 
 # Google Docs API setup
 SCOPES = ['https://www.googleapis.com/auth/documents']
+TOKEN_FILE = 'token.json'
+# Token file written by earlier versions, which stored credentials with pickle
+LEGACY_TOKEN_FILE = 'token.pickle'
 
-# Initialize OpenAI client
-client = OpenAI(
-    api_key=os.getenv("OPENAI_API_KEY")
-)
+# Credentials loaded by get_google_auth, reused for the rest of the run
+_cached_creds = None
 
 MODEL_NAME = "gpt-4o-mini"
-SUPPORTED_ENCODINGS = ['utf-8', 'utf-16', 'ascii', 'iso-8859-1', 'cp1252']
+# Minimum cosine similarity for reusing a cached response
+TAILOR_CACHE_THRESHOLD = 0.95
+# Batch mode: concurrent tailorings, and retries of rate-limited API calls
+BATCH_CONCURRENCY = 10
+# OpenAI Batch API mode: half-price, non-realtime completions
+BATCH_COMPLETION_WINDOW = '24h'
+BATCH_POLL_INTERVAL = 30
+BATCH_TERMINAL_STATUSES = {'completed', 'failed', 'expired', 'cancelled'}
+RATE_LIMIT_MAX_RETRIES = 5
+# Wait for the rate limit window to reset when fewer requests or tokens
+# than this remain (the token floor roughly covers one tailoring request)
+RATE_LIMIT_MIN_REQUESTS = 2
+RATE_LIMIT_MIN_TOKENS = 8000
+
+# Latest rate limit budget reported by the OpenAI API response headers
+_ratelimit_state = {
+    'rem_req': math.inf,
+    'rem_tok': math.inf,
+    'reset_req_at': 0.0,
+    'reset_tok_at': 0.0
+}
+# cp1252 goes before iso-8859-1, which decodes any byte string and would
+# otherwise turn cp1252 punctuation into control characters
+SUPPORTED_ENCODINGS = ['utf-8', 'utf-16', 'ascii', 'cp1252', 'iso-8859-1']
+# Encodings charset-normalizer may choose between once UTF-8 has failed.
+# Left unrestricted, it guesses Asian or Central European code pages for
+# short Western European postings.
+DETECTED_ENCODINGS = ['utf_16', 'cp1252', 'latin_1']
+
+# Static part of the tailoring prompt. It is sent first and never changes
+# between runs so OpenAI's prompt caching can reuse the prefix.
+TAILOR_SYSTEM_PROMPT = textwrap.dedent("""\
+    You are an expert at tailoring resumes to job descriptions.
+
+    Instructions:
+    - Maintain truthfulness - never fabricate experience
+    - Maintain the exact same formatting as the original resume
+    - Keep overall length similar to original
+    - Follow the tailoring guidelines and tailoring level given in the next message
+
+    Formatting:
+    - Keep every section heading, in the original order unless asked to restructure
+    - Keep bullet points as bullet points, one line per bullet
+    - Keep names, contact details, employers, job titles and dates exactly as written
+    - Use plain text only: no Markdown, code fences or commentary
+
+    Only output the modified resume content, no explanations or other text.""")
+
+# Extra instructions and response schema used when the job details are
+# extracted in the same completion as the tailored resume
+JOB_DETAILS_INSTRUCTIONS = """Also extract the company name and exact job title from the job posting.
+Use the official title as written, not a generic version.
+Respond with JSON containing the company, the title and the tailored resume content."""
+TAILORED_RESUME_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "tailored_resume",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "company": {"type": "string"},
+                "title": {"type": "string"},
+                "tailored_resume": {"type": "string"}
+            },
+            "required": ["company", "title", "tailored_resume"],
+            "additionalProperties": False
+        }
+    }
+}
+
+_DURATION_RE = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+_DURATION_UNITS = {'h': 3600.0, 'm': 60.0, 's': 1.0, 'ms': 0.001}
+
+_DOC_ID_RE = re.compile(r'/document/d/([a-zA-Z0-9-_]+)')
+_UNSAFE_FILENAME_RE = re.compile(r'[\\/:*?"<>|\x00-\x1f]+')
+
+# Structured job posting headers that make the extraction API call unnecessary
+JOB_HEADER_LINES = 20
+_COMPANY_RE = re.compile(r'(?im)^\s*company(?:\s*name)?\s*[:\-]\s*(.{1,100}?)\s*$')
+_TITLE_RE = re.compile(r'(?im)^\s*(?:job\s*title|position|role)\s*[:\-]\s*(.{1,100}?)\s*$')
+_HIRING_RE = re.compile(
+    r'(?i)(?!\s*(?:we|we\'re|i|i\'m|they|you|everyone|everybody|someone|nobody)\b)'
+    r'\s*(.{1,100}?)\s+is\s+hiring(?:\s+an?\b)?\s*:?\s+(.{1,100}?)\s*$'
+)
+# A company name or job title: capitalized words, joined by a few lowercase
+# connectors, with no sentence punctuation
+_NAME_WORD = r"(?:\(?[A-Z0-9][\w.,&/+#'()-]*|of|and|for|the|in|at|to|&|[-/|])"
+_NAME_RE = re.compile(rf"{_NAME_WORD}(?:\s+{_NAME_WORD})*")
+# Employment terms that "Position:" or "Role:" fields sometimes hold instead
+_EMPLOYMENT_TERMS_RE = re.compile(
+    r'(?i)\b(?:full|part)[\s-]?time\b|\b(?:remote|hybrid|on[\s-]?site|contract|'
+    r'internship|temporary|permanent)\b'
+)
+
+# textStyle properties that updateTextStyle can write back
+_WRITABLE_STYLE_KEYS = frozenset({
+    'bold', 'italic', 'underline', 'strikethrough', 'smallCaps',
+    'backgroundColor', 'foregroundColor', 'fontSize', 'weightedFontFamily',
+    'baselineOffset', 'link'
+})
+
+# Socket timeout, in seconds, for the shared Docs HTTP connection
+HTTP_TIMEOUT = 30
+
+# Only request the parts of the document we actually parse
+DOCUMENT_FIELDS = 'title,body(content(paragraph(elements(textRun(content,textStyle)))))'
 
 logging.basicConfig(
     level=logging.INFO,
@@ -43,6 +163,100 @@ class APIError(ResumeError):
     """Raised when there's an error with API calls."""
     pass
 
+@functools.lru_cache(maxsize=None)
+def get_openai_client():
+    """Create the async OpenAI client on first use.
+    
+    Returns:
+        AsyncOpenAI: The shared OpenAI client.
+    """
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+
+@functools.lru_cache(maxsize=None)
+def get_response_cache(client):
+    """Return the semantic cache of previous responses for a client.
+    
+    Args:
+        client: The async OpenAI client used to compute embeddings.
+        
+    Returns:
+        SemanticCache: The response cache, keyed on embeddings of the inputs.
+    """
+    return SemanticCache(client)
+
+
+@functools.lru_cache(maxsize=None)
+def get_exact_cache():
+    """Return the cache of previous responses keyed on the exact inputs.
+    
+    Returns:
+        ExactCache: The response cache.
+    """
+    return ExactCache()
+
+
+async def lookup_cached_response(client, namespace, key_text, messages, threshold,
+                                 response_format=None):
+    """Look up a previous response, first by exact inputs, then by similarity.
+    
+    The exact key covers the model, every message and the response format,
+    so any prompt change invalidates it. The semantic lookup only compares
+    key_text within the namespace, and is skipped when no threshold is
+    given. A failed embedding request counts as a miss.
+    
+    Args:
+        client: The async OpenAI client instance.
+        namespace (str): Everything a semantic hit must match exactly, such
+            as the request kind, the resume and the tailoring level.
+        key_text (str): The input compared by similarity.
+        messages (list): The chat messages of the request.
+        threshold (float): Minimum cosine similarity for a semantic hit, or
+            None to use only the exact cache.
+        response_format (dict): The response_format of the request, if any.
+        
+    Returns:
+        tuple: (cached response or None, cache token). Pass the token to
+            store_cached_response on a miss.
+    """
+    import openai
+
+    exact_key = ExactCache.key(
+        MODEL_NAME,
+        json.dumps(messages, sort_keys=True),
+        json.dumps(response_format, sort_keys=True)
+    )
+    cached = get_exact_cache().get(exact_key)
+    if cached is not None:
+        return cached, None
+
+    if threshold is None:
+        return None, (namespace, exact_key, None)
+
+    try:
+        cached, embedding = await get_response_cache(client).lookup(namespace, key_text, threshold)
+    except openai.APIError as e:
+        logging.warning(f"Semantic cache lookup failed, continuing without it: {str(e)}")
+        return None, (namespace, exact_key, None)
+    return cached, (namespace, exact_key, embedding)
+
+
+def store_cached_response(client, cache_token, response):
+    """Store a response in both caches after a lookup missed.
+    
+    Args:
+        client: The async OpenAI client instance.
+        cache_token (tuple): The token returned by lookup_cached_response.
+        response: A JSON-serializable response.
+    """
+    namespace, exact_key, embedding = cache_token
+    get_exact_cache().set(exact_key, response)
+    if embedding is not None:
+        get_response_cache(client).store(namespace, embedding, response)
+
+
 def check_environment():
     """Check if all required environment variables are set.
 
@@ -65,8 +279,10 @@ def extract_doc_id(doc_link):
     Raises:
         ValueError: If the link format is invalid.
     """
-    pattern = r'/document/d/([a-zA-Z0-9-_]+)'
-    match = re.search(pattern, doc_link)
+    # Cheap substring check before running the regex
+    if '/document/d/' not in doc_link:
+        raise ValueError("Invalid Google Doc link format")
+    match = _DOC_ID_RE.search(doc_link)
     if not match:
         raise ValueError("Invalid Google Doc link format")
     return match.group(1)
@@ -75,17 +291,29 @@ def extract_doc_id(doc_link):
 def get_google_auth():
     """Initialize and return Google authentication credentials.
     
+    Credentials are memoized after the first successful load. The OAuth flow
+    and transport modules are only imported when the token has to be
+    created or refreshed.
+    
     Returns:
         Credentials: The authenticated Google credentials.
         
     Raises:
-        Exception: If authentication fails.
+        OSError: If credentials.json cannot be read or the token cannot be saved.
+        GoogleAuthError: If the OAuth flow fails.
     """
+    global _cached_creds
+
+    from google.auth.exceptions import GoogleAuthError
+    from google.oauth2.credentials import Credentials
+
     def remove_token_and_retry():
-        """Remove token.pickle and create new credentials."""
-        if os.path.exists('token.pickle'):
+        """Remove the saved token and create new credentials."""
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
+        if os.path.exists(TOKEN_FILE):
             logging.info("Removing expired token...")
-            os.remove('token.pickle')
+            os.remove(TOKEN_FILE)
         
         logging.info("Getting new token...")
         flow = InstalledAppFlow.from_client_secrets_file(
@@ -93,88 +321,253 @@ def get_google_auth():
         new_creds = flow.run_local_server(port=0)
         
         # Save the new credentials
-        with open('token.pickle', 'wb') as token:
-            pickle.dump(new_creds, token)
+        with open(TOKEN_FILE, 'w') as token:
+            token.write(new_creds.to_json())
         
         return new_creds
 
-    try:
-        creds = None
-        
-        # Try to load existing credentials
-        if os.path.exists('token.pickle'):
+    if _cached_creds and _cached_creds.valid:
+        return _cached_creds
+
+    # The pickled token is never loaded; remove it so the refresh token
+    # it holds doesn't linger on disk
+    if os.path.exists(LEGACY_TOKEN_FILE):
+        logging.info(f"Removing legacy {LEGACY_TOKEN_FILE}...")
+        os.remove(LEGACY_TOKEN_FILE)
+
+    creds = None
+    
+    # Try to load existing credentials
+    if os.path.exists(TOKEN_FILE):
+        try:
+            creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Error reading {TOKEN_FILE}: {str(e)}")
+            creds = None
+    
+    # If no valid credentials available, let user log in
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
             try:
-                with open('token.pickle', 'rb') as token:
-                    creds = pickle.load(token)
-            except Exception as e:
-                logging.warning(f"Error reading token.pickle: {str(e)}")
-                return remove_token_and_retry()
-        
-        # If no valid credentials available, let user log in
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                try:
-                    logging.info("Refreshing expired token...")
-                    creds.refresh(Request())
-                    # Save the refreshed credentials
-                    with open('token.pickle', 'wb') as token:
-                        pickle.dump(creds, token)
-                except Exception as e:
-                    logging.warning(f"Error refreshing token: {str(e)}")
-                    return remove_token_and_retry()
-            else:
-                return remove_token_and_retry()
+                from google.auth.transport.requests import Request
 
-        return creds
+                logging.info("Refreshing expired token...")
+                creds.refresh(Request())
+                # Save the refreshed credentials
+                with open(TOKEN_FILE, 'w') as token:
+                    token.write(creds.to_json())
+            except GoogleAuthError as e:
+                logging.warning(f"Error refreshing token: {str(e)}")
+                creds = remove_token_and_retry()
+        else:
+            creds = remove_token_and_retry()
+
+    _cached_creds = creds
+    return creds
 
-    except Exception as e:
-        raise Exception(f"Failed to authenticate with Google: {str(e)}")
 
+def clear_google_auth():
+    """Forget the cached Google credentials and remove the saved token."""
+    global _cached_creds
+    _cached_creds = None
+    if os.path.exists(TOKEN_FILE):
+        os.remove(TOKEN_FILE)
 
-def read_doc(service: Resource, doc_id: str) -> Tuple[str, List[Dict[str, Any]]]:
-    """Read and return the content and styling of a Google Doc.
+
+@functools.lru_cache(maxsize=None)
+def get_json_model():
+    """Return a Google API client model that uses orjson for request bodies.
+    
+    The default JsonModel uses the stdlib json module, which is noticeably
+    slower on large batchUpdate bodies with many style requests.
+    
+    Returns:
+        JsonModel: The model instance to pass to build().
+    """
+    import orjson
+    from googleapiclient.model import JsonModel
+
+    class OrjsonModel(JsonModel):
+        """JsonModel that serializes and parses with orjson."""
+
+        def serialize(self, body_value):
+            if (isinstance(body_value, dict) and 'data' not in body_value
+                    and self._data_wrapper):
+                body_value = {'data': body_value}
+            return orjson.dumps(body_value).decode('utf-8')
+
+        def deserialize(self, content):
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                return content.decode('utf-8') if isinstance(content, bytes) else content
+            if self._data_wrapper and 'data' in body:
+                body = body['data']
+            return body
+
+    return OrjsonModel()
+
+
+def build_docs_service(creds):
+    """Build the Google Docs service on a single keep-alive HTTP connection.
+    
+    Every Docs call in a run goes through the same AuthorizedHttp, so the
+    TLS connection is opened once and reused, and requests time out after
+    HTTP_TIMEOUT seconds instead of hanging. The service is built from the
+    discovery document bundled with google-api-python-client, so no
+    discovery request is made.
+    
+    Args:
+        creds: The authenticated Google credentials.
+        
+    Returns:
+        Resource: The Google Docs service instance.
+    """
+    import httplib2
+    from google_auth_httplib2 import AuthorizedHttp
+    from googleapiclient.discovery import build
+
+    http = AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+    return build('docs', 'v1', http=http, model=get_json_model(),
+                 static_discovery=True, cache_discovery=False)
+
+
+def fetch_document(service: 'Resource', doc_id: str,
+                   fields: Optional[str] = DOCUMENT_FIELDS) -> Dict[str, Any]:
+    """Fetch a Google Doc resource with a single API call.
+    
+    By default only the title and text runs are requested (see
+    DOCUMENT_FIELDS), which keeps the response small for documents with
+    images, lists or suggestions.
     
     Args:
         service: The Google Docs service instance.
-        doc_id: The ID of the document to read.
+        doc_id: The ID of the document to fetch.
+        fields: Partial response field mask, or None for the full resource.
+        
+    Returns:
+        The document resource as returned by the Docs API.
+    """
+    return service.documents().get(documentId=doc_id, fields=fields).execute()
+
+
+def wait_for_document(fetch_future, docs_service, doc_id):
+    """Wait for a background fetch of the base resume.
+    
+    The fetch doubles as the credential check: if the saved token turns out
+    to be revoked (invalid_grant), the user is asked to sign in again and
+    the document is fetched once more.
+    
+    Args:
+        fetch_future: Future returned by submitting fetch_document.
+        docs_service: The Google Docs service instance the fetch used.
+        doc_id (str): The ID of the base resume document.
+        
+    Returns:
+        tuple: (docs_service, document), with a rebuilt service if the
+            credentials had to be renewed.
+    """
+    from google.auth.exceptions import RefreshError
+
+    try:
+        return docs_service, fetch_future.result()
+    except RefreshError as e:
+        if 'invalid_grant' not in str(e):
+            raise
+        logging.warning("Token validation failed, retrying authentication...")
+        clear_google_auth()
+        docs_service = build_docs_service(get_google_auth())
+        return docs_service, fetch_document(docs_service, doc_id)
+
+
+@functools.lru_cache(maxsize=None)
+def style_fields(style_keys):
+    """Return the updateTextStyle field mask for a set of style keys.
+    
+    Keys are sorted so equal sets always produce the same mask.
+    
+    Args:
+        style_keys (frozenset): The keys of a textStyle dictionary.
+        
+    Returns:
+        str: Comma-separated field names.
+    """
+    return ','.join(sorted(style_keys))
+
+
+def read_doc(document: Dict[str, Any]) -> Tuple[str, str, List[Dict[str, Any]]]:
+    """Parse and return the title, content and styling of a Google Doc.
+    
+    Args:
+        document: The document resource returned by fetch_document.
         
     Returns:
         A tuple containing:
+            - The document's title
             - The document's text content
             - A list of style dictionaries, each containing:
                 - start_index: Starting position of the style
                 - end_index: Ending position of the style
                 - style: Dictionary of style attributes
+                - fields: updateTextStyle field mask for the style
+    """
+    doc_content = document.get('body', {}).get('content', [])
+    # Flatten paragraphs into their text runs in a single pass
+    text_runs = (
+        para_element['textRun']
+        for element in doc_content if 'paragraph' in element
+        for para_element in element['paragraph'].get('elements', ())
+        if 'textRun' in para_element
+    )
+    parts = []
+    styles = []
+    parts_append = parts.append
+    styles_append = styles.append
+    last_style = None
+    current_index = 0
+    
+    for text_run in text_runs:
+        content = text_run['content']
+        if not content:
+            continue
+        # Keep only writable, non-empty style properties; unstyled runs
+        # need no updateTextStyle request at all
+        style = {
+            key: value for key, value in text_run.get('textStyle', {}).items()
+            if key in _WRITABLE_STYLE_KEYS and value not in (None, {})
+        }
+        end_index = current_index + len(content)
+        if style:
+            # Extend the previous run instead when styled alike
+            if (last_style is not None and last_style['style'] == style
+                    and last_style['end_index'] == current_index):
+                last_style['end_index'] = end_index
+            else:
+                last_style = {
+                    'start_index': current_index,
+                    'end_index': end_index,
+                    'style': style,
+                    'fields': style_fields(frozenset(style))
+                }
+                styles_append(last_style)
+        parts_append(content)
+        current_index = end_index
+    
+    text = ''.join(parts)
+    return document.get('title', 'Resume'), text.strip(), styles
+
+
+def require_interactive(option):
+    """Make sure the user can be prompted for a value.
+    
+    Args:
+        option (str): The command line option that supplies the value.
         
     Raises:
-        Exception: If the document cannot be accessed or read.
+        ValueError: If stdin is not a terminal.
     """
-    try:
-        document = service.documents().get(documentId=doc_id).execute()
-        doc_content = document.get('body', {}).get('content', [])
-        text = ''
-        styles = []
-        current_index = 0
-        
-        for element in doc_content:
-            if 'paragraph' in element:
-                for para_element in element['paragraph']['elements']:
-                    if 'textRun' in para_element:
-                        text_run = para_element['textRun']
-                        content = text_run['content']
-                        # Always capture the style, even if it's empty
-                        style_info = {
-                            'start_index': current_index,
-                            'end_index': current_index + len(content),
-                            'style': text_run.get('textStyle', {})
-                        }
-                        styles.append(style_info)
-                        text += content
-                        current_index += len(content)
-        
-        return text.strip(), styles
-    except Exception as e:
-        raise Exception(f"Failed to read document: {str(e)}")
+    if not sys.stdin.isatty():
+        raise ValueError(f"{option} is required when not running interactively")
 
 
 def get_base_resume():
@@ -184,8 +577,10 @@ def get_base_resume():
         str: The ID of the base resume document.
 
     Raises:
-        ValueError: If the link format is invalid.
+        ValueError: If the link format is invalid, or stdin is not a terminal.
     """
+    require_interactive('--doc-link')
+
     print("\nPlease share your resume.")
     print("1. Open your resume in Google Docs")
     print("2. Click 'Share' and copy the link")
@@ -200,6 +595,69 @@ def get_base_resume():
             print("Invalid link format. Please provide a valid Google Doc link.")
 
 
+def decode_text(raw):
+    """Decode file bytes, detecting the encoding in as few passes as possible.
+    
+    A byte order mark decides the encoding outright. Otherwise UTF-8, by far
+    the most common case, is tried first, then charset-normalizer's best
+    guess among DETECTED_ENCODINGS, then each of SUPPORTED_ENCODINGS in order.
+    
+    Args:
+        raw (bytes): The file content.
+        
+    Returns:
+        str: The decoded text, or None if no encoding fits.
+    """
+    if raw.startswith(codecs.BOM_UTF8):
+        return raw.decode('utf-8-sig')
+    if raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return raw.decode('utf-16')
+
+    try:
+        return raw.decode('utf-8')
+    except UnicodeDecodeError:
+        pass
+
+    from charset_normalizer import from_bytes
+
+    best_match = from_bytes(raw, cp_isolation=DETECTED_ENCODINGS).best()
+    if best_match is not None:
+        return str(best_match)
+
+    for encoding in SUPPORTED_ENCODINGS:
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+def read_file_with_encodings(file_path):
+    """Read a text file once and decode it with its detected encoding.
+    
+    Args:
+        file_path (str): Path to the file.
+        
+    Returns:
+        str: The stripped file content, with universal newlines as in text
+            mode.
+        
+    Raises:
+        FileReadError: If the file is empty or cannot be decoded.
+        FileNotFoundError: If the file does not exist.
+    """
+    with open(file_path, 'rb') as file:
+        raw = file.read()
+
+    content = decode_text(raw)
+    if content is None:
+        raise FileReadError(f"Unable to read file with supported encodings: {file_path}")
+    content = content.replace('\r\n', '\n').replace('\r', '\n').strip()
+    if not content:
+        raise FileReadError("File is empty")
+    return content
+
+
 def get_job_posting():
     """Get job posting text from file.
     
@@ -211,31 +669,20 @@ def get_job_posting():
         
     Raises:
         FileReadError: If there's an error reading the file.
+        ValueError: If a prompt is needed but stdin is not a terminal.
     """
-    def read_file_with_encodings(file_path):
-        """Helper function to read file with different encodings."""
-        for encoding in SUPPORTED_ENCODINGS:
-            try:
-                with open(file_path, 'r', encoding=encoding) as file:
-                    content = file.read().strip()
-                    if not content:
-                        raise FileReadError("File is empty")
-                    return content
-            except UnicodeDecodeError:
-                continue
-        raise FileReadError(f"Unable to read file with supported encodings: {file_path}")
-
     # First try job_posting.txt in current directory
     default_file = 'job_posting.txt'
     if os.path.exists(default_file):
         try:
             logging.info(f"Found {default_file}, attempting to read...")
             return read_file_with_encodings(default_file)
-        except Exception as e:
+        except (FileReadError, OSError) as e:
             logging.warning(f"Error reading {default_file}: {str(e)}")
             # Fall through to manual input
     
     # If default file not found or failed to read, prompt user
+    require_interactive('--job-file')
     print("\nPlease provide the path to the job posting text file.")
     print("Example: ./job_posting.txt")
     print("(Press Ctrl+C to exit)\n")
@@ -260,17 +707,114 @@ def get_job_posting():
             raise SystemExit(0)
 
 
-def tailor_resume(client, resume_text, job_text, temperature):
-    """Generate a tailored version of the resume for the job posting.
+def parse_reset_duration(value):
+    """Convert a rate limit reset header such as '6m0s' or '20ms' to seconds.
+    
+    Args:
+        value (str): The header value.
+        
+    Returns:
+        float: The duration in seconds.
+    """
+    return sum(float(amount) * _DURATION_UNITS[unit]
+               for amount, unit in _DURATION_RE.findall(value))
+
+
+def update_ratelimit_state(headers):
+    """Record the remaining rate limit budget from OpenAI response headers.
+    
+    Args:
+        headers: The HTTP response headers.
+    """
+    now = time.monotonic()
+    for kind, state_key in (('requests', 'req'), ('tokens', 'tok')):
+        remaining = headers.get(f'x-ratelimit-remaining-{kind}')
+        reset = headers.get(f'x-ratelimit-reset-{kind}')
+        if remaining is not None:
+            _ratelimit_state[f'rem_{state_key}'] = int(remaining)
+        if reset is not None:
+            _ratelimit_state[f'reset_{state_key}_at'] = now + parse_reset_duration(reset)
+
+
+def get_ratelimit_delay():
+    """Return how long to wait before submitting another request.
+    
+    Returns:
+        float: Seconds until the exhausted rate limit window resets, or 0.
+    """
+    now = time.monotonic()
+    delay = 0.0
+    if _ratelimit_state['rem_req'] < RATE_LIMIT_MIN_REQUESTS:
+        delay = max(delay, _ratelimit_state['reset_req_at'] - now)
+    if _ratelimit_state['rem_tok'] < RATE_LIMIT_MIN_TOKENS:
+        delay = max(delay, _ratelimit_state['reset_tok_at'] - now)
+    return delay
+
+
+async def create_chat_completion(client, **kwargs):
+    """Create a chat completion, throttling and backing off when rate limited.
+    
+    Before submitting, waits for the rate limit window to reset if the
+    budget reported by the last response is nearly exhausted. Any 429 that
+    still occurs is retried with exponential backoff and jitter, so
+    concurrent batch runs recover instead of failing.
+    
+    Args:
+        client: The async OpenAI client instance.
+        **kwargs: Arguments for client.chat.completions.create.
+        
+    Returns:
+        The completion, or a stream if stream=True was passed.
+        
+    Raises:
+        RateLimitError: If the request is still rate limited after
+            RATE_LIMIT_MAX_RETRIES attempts.
+    """
+    from openai import RateLimitError
+    from tenacity import (AsyncRetrying, retry_if_exception_type, stop_after_attempt,
+                          wait_exponential, wait_random)
+
+    def log_retry(retry_state):
+        logging.warning(f"Rate limited, retrying in {retry_state.next_action.sleep:.1f}s...")
+
+    async for attempt in AsyncRetrying(
+        retry=retry_if_exception_type(RateLimitError),
+        wait=wait_exponential(min=1) + wait_random(0, 1),
+        stop=stop_after_attempt(RATE_LIMIT_MAX_RETRIES),
+        before_sleep=log_retry,
+        reraise=True
+    ):
+        with attempt:
+            delay = get_ratelimit_delay()
+            if delay > 0:
+                logging.info(f"Rate limit nearly exhausted, waiting {delay:.1f}s...")
+                await asyncio.sleep(delay)
+            # Count this request against the budget until the response reports it
+            _ratelimit_state['rem_req'] -= 1
+
+            response = await client.chat.completions.with_raw_response.create(**kwargs)
+            update_ratelimit_state(response.headers)
+            return response.parse()
+
+
+def build_tailoring_messages(resume_text, job_text, temperature, extract_details=False):
+    """Build the chat messages that ask the model to tailor the resume.
+    
+    Messages are ordered from least to most variable: the static system
+    prompt, the guidelines (fixed per tailoring level), then the resume
+    ahead of the job posting. Runs that share a resume and tailoring level,
+    such as a batch, therefore share a long prompt prefix that OpenAI's
+    prompt caching can reuse.
     
     Args:
-        client: The OpenAI client instance.
         resume_text (str): The original resume content.
         job_text (str): The job posting content.
         temperature (float): Tailoring intensity between 0.0 and 1.0
+        extract_details (bool): Also ask for the company name and job title,
+            answered as JSON matching TAILORED_RESUME_FORMAT.
         
     Returns:
-        str: The tailored resume content.
+        list: The messages for the chat completion.
     """
     # Create dynamic instructions based on temperature
     base_instructions = [
@@ -306,122 +850,288 @@ def tailor_resume(client, resume_text, job_text, temperature):
     preservation_note = f"Preserve approximately {int((1 - temperature) * 100)}% of the original content"
     matching_note = f"Match approximately {int(temperature * 100)}% of key terms and skills from the job posting"
     
+    guidelines = (
+        f"Tailoring Guidelines:\n{instructions}\n\n"
+        f"Tailoring Level:\n- {preservation_note}\n- {matching_note}"
+    )
+    if extract_details:
+        guidelines += f"\n\n{JOB_DETAILS_INSTRUCTIONS}"
+
+    return [
+        {
+            "role": "system", 
+            "content": TAILOR_SYSTEM_PROMPT
+        },
+        {
+            "role": "system",
+            "content": guidelines
+        },
+        {
+            "role": "user", 
+            "content": f"Original Resume:\n\n{resume_text}\n\nJob Posting:\n\n{job_text}\n\nProvide the tailored resume:"
+        }
+    ]
+
+
+async def tailor_resume(client, resume_text, job_text, temperature, echo=False):
+    """Generate a tailored version of the resume for the job posting.
+    
+    Args:
+        client: The async OpenAI client instance.
+        resume_text (str): The original resume content.
+        job_text (str): The job posting content.
+        temperature (float): Tailoring intensity between 0.0 and 1.0
+        echo (bool): Print the resume to stdout as it streams in, or at
+            once when it comes from the cache.
+        
+    Returns:
+        str: The tailored resume content.
+        
+    Raises:
+        APIError: If the OpenAI request fails.
+    """
+    import openai
+
+    messages = build_tailoring_messages(resume_text, job_text, temperature)
+
     try:
-        completion = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system", 
-                    "content": f"""You are an expert at tailoring resumes to job descriptions.
-                    
-                    Tailoring Guidelines:
-                    {instructions}
-                    
-                    Additional Instructions:
-                    - {preservation_note}
-                    - {matching_note}
-                    - Maintain truthfulness - never fabricate experience
-                    - Maintain the exact same formatting as the original resume
-                    - Keep overall length similar to original
-                    
-                    Only output the modified resume content, no explanations or other text."""
-                },
-                {
-                    "role": "user", 
-                    "content": f"Job Posting:\n\n{job_text}\n\nOriginal Resume:\n\n{resume_text}\n\nProvide the tailored resume:"
-                }
-            ]
+        # Reuse a previous result for the same resume and tailoring level
+        # and the same (or a near-identical) job posting
+        cached, cache_token = await lookup_cached_response(
+            client, f"tailor:{ExactCache.key(resume_text)}:{temperature}", job_text,
+            messages, TAILOR_CACHE_THRESHOLD
         )
-        return completion.choices[0].message.content
-    except Exception as e:
-        raise Exception(f"Failed to tailor resume: {str(e)}")
+        if cached is not None:
+            if echo:
+                print(cached)
+            return cached
+
+        stream = await create_chat_completion(
+            client,
+            model=MODEL_NAME,
+            stream=True,
+            messages=messages
+        )
+        parts = []
+        async for chunk in stream:
+            piece = chunk.choices[0].delta.content if chunk.choices else None
+            if piece:
+                parts.append(piece)
+                if echo:
+                    sys.stdout.write(piece)
+                    sys.stdout.flush()
+        if echo:
+            sys.stdout.write('\n')
+        tailored = ''.join(parts)
+        store_cached_response(client, cache_token, tailored)
+        return tailored
+    except openai.APIError as e:
+        raise APIError(f"Failed to tailor resume: {str(e)}") from e
 
 
-def extract_job_details(client, job_text):
-    """Extract company name and job title from job posting using OpenAI API.
+def parse_tailored_response(content):
+    """Parse a JSON response requested with TAILORED_RESUME_FORMAT.
     
     Args:
-        client: The OpenAI client instance.
+        content (str): The message content returned by the model.
+        
+    Returns:
+        tuple: (company_name, job_title, tailored_content)
+        
+    Raises:
+        ValueError: If the response is not valid JSON or a field is empty.
+    """
+    response = json.loads(content)
+    company = response.get('company', '').strip()
+    title = response.get('title', '').strip()
+    tailored = response.get('tailored_resume', '')
+    if not company or not title:
+        raise ValueError("Failed to extract company name or job title from response")
+    if not tailored.strip():
+        raise ValueError("Response did not contain a tailored resume")
+    return company, title, tailored
+
+
+async def tailor_and_extract(client, resume_text, job_text, temperature):
+    """Tailor the resume and extract the job details in a single completion.
+    
+    Args:
+        client: The async OpenAI client instance.
+        resume_text (str): The original resume content.
         job_text (str): The job posting content.
+        temperature (float): Tailoring intensity between 0.0 and 1.0
         
     Returns:
-        tuple: (company_name, job_title)
+        tuple: (company_name, job_title, tailored_content)
         
     Raises:
-        ValueError: If company name or job title cannot be extracted.
-        Exception: If API call fails.
+        APIError: If the OpenAI request fails.
+        ValueError: If the response cannot be parsed.
     """
+    import openai
+
+    messages = build_tailoring_messages(resume_text, job_text, temperature, extract_details=True)
+
     try:
-        completion = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": """Extract the company name and exact job title from the job posting.
-                    Use the official title as written, not a generic version.
-                    Respond in the format:
-                    Company: <name>
-                    Title: <title>"""
-                },
-                {
-                    "role": "user",
-                    "content": job_text
-                }
-            ]
+        # Only reuse exact matches: a similar but different posting would
+        # bring along its company and job title, which name the new document
+        cached, cache_token = await lookup_cached_response(
+            client, "tailor_and_extract", job_text, messages, None,
+            response_format=TAILORED_RESUME_FORMAT
         )
-        response = completion.choices[0].message.content
-        
-        # Parse response
-        company = ""
-        title = ""
-        for line in response.split('\n'):
-            if line.startswith('Company:'):
-                company = line.replace('Company:', '').strip()
-            elif line.startswith('Title:'):
-                title = line.replace('Title:', '').strip()
-        
-        if not company or not title:
-            raise ValueError("Failed to extract company name or job title from response")
-            
-        return company, title
-    except Exception as e:
-        raise Exception(f"Failed to extract job details: {str(e)}")
+        if cached is not None:
+            return tuple(cached)
+
+        completion = await create_chat_completion(
+            client,
+            model=MODEL_NAME,
+            messages=messages,
+            response_format=TAILORED_RESUME_FORMAT
+        )
+        result = parse_tailored_response(completion.choices[0].message.content)
+        store_cached_response(client, cache_token, list(result))
+        return result
+    except openai.APIError as e:
+        raise APIError(f"Failed to tailor resume: {str(e)}") from e
 
 
-def get_base_doc_title(service, doc_id):
-    """Get the title of the base resume document.
+def parse_job_details(job_text):
+    """Extract company name and job title from a structured posting header.
+    
+    Only the first JOB_HEADER_LINES lines are searched for explicit
+    "Company:" / "Job Title:" fields; otherwise the first non-empty line
+    may be a LinkedIn-style "<Company> is hiring <Title>" line. The "is" is
+    required, so openers like "Now hiring <Title>" go to the model. Both values
+    must look like names, since they go straight into the document title.
     
     Args:
-        service: The Google Docs service instance.
-        doc_id (str): The ID of the document.
+        job_text (str): The job posting content.
         
     Returns:
-        str: The document title.
+        tuple: (company_name, job_title), or None if either is not found.
     """
-    try:
-        document = service.documents().get(documentId=doc_id).execute()
-        return document.get('title', 'Resume')
-    except Exception as e:
-        raise Exception(f"Failed to get document title: {str(e)}")
+    def is_name(text):
+        return _NAME_RE.fullmatch(text) and not _EMPLOYMENT_TERMS_RE.search(text)
 
+    lines = job_text.splitlines()[:JOB_HEADER_LINES]
+    header = '\n'.join(lines)
+    company = _COMPANY_RE.search(header)
+    title = _TITLE_RE.search(header)
+    if company and title:
+        details = company.group(1), title.group(1)
+    else:
+        first_line = next((line for line in lines if line.strip()), '')
+        hiring = _HIRING_RE.match(first_line)
+        if not hiring:
+            return None
+        details = hiring.group(1), hiring.group(2)
 
-def create_tailored_resume(service, title, content, styles):
-    """Create a new Google Doc with the tailored resume, preserving formatting.
+    if all(is_name(value) for value in details):
+        return details
+    return None
+
+
+async def get_tailored_resume(client, resume_text, job_text, temperature,
+                              on_details=None, echo=False):
+    """Tailor the resume and determine the company name and job title.
+    
+    Postings with a structured header are parsed locally and only the
+    tailoring goes to the model; otherwise both come from one completion.
+    
+    Args:
+        client: The async OpenAI client instance.
+        resume_text (str): The original resume content.
+        job_text (str): The job posting content.
+        temperature (float): Tailoring intensity between 0.0 and 1.0
+        on_details: Optional coroutine function awaited with (company_name,
+            job_title) once they are known. For parsed headers it runs
+            while the tailored resume streams in.
+        echo (bool): Print a streamed tailored resume to stdout.
+        
+    Returns:
+        tuple: (company_name, job_title, tailored_content)
+    """
+    details = parse_job_details(job_text)
+    if details:
+        tailoring = tailor_resume(client, resume_text, job_text, temperature, echo=echo)
+        if on_details is None:
+            return (*details, await tailoring)
+        _, tailored_content = await asyncio.gather(on_details(*details), tailoring)
+        return (*details, tailored_content)
+
+    company_name, job_title, tailored_content = await tailor_and_extract(
+        client, resume_text, job_text, temperature
+    )
+    if on_details is not None:
+        await on_details(company_name, job_title)
+    return company_name, job_title, tailored_content
+
+
+def merge_styles(styles):
+    """Coalesce adjacent style ranges that share the same text style.
+    
+    Ranges with an empty style are dropped, since they would produce an
+    updateTextStyle request with no fields to update.
+    
+    Args:
+        styles (list): List of text style information, in document order.
+        
+    Returns:
+        list: The merged style information.
+    """
+    merged = []
+    for style_info in styles:
+        if not style_info['style']:
+            continue
+        if (merged and merged[-1]['style'] == style_info['style']
+                and merged[-1]['end_index'] == style_info['start_index']):
+            merged[-1]['end_index'] = style_info['end_index']
+        else:
+            merged.append(dict(style_info))
+    return merged
+
+
+def create_document(service, title):
+    """Create a new, empty Google Doc.
     
     Args:
         service: The Google Docs service instance.
         title (str): The title for the new document.
-        content (str): The resume content.
-        styles (list): List of text style information.
         
     Returns:
         str: The ID of the created document.
+        
+    Raises:
+        HttpError: If the Docs API request fails.
     """
+    from googleapiclient.errors import HttpError
+
     try:
-        # Create new document
-        document = service.documents().create(body={'title': title}).execute()
-        doc_id = document.get('documentId')
+        document = service.documents().create(
+            body={'title': title},
+            fields='documentId'
+        ).execute()
+        return document.get('documentId')
+    except HttpError as e:
+        logging.error(f"Failed to create document {title}: {str(e)}")
+        raise
+
+
+def write_tailored_resume(service, doc_id, content, styles):
+    """Insert the tailored resume into an empty document, preserving formatting.
+    
+    Args:
+        service: The Google Docs service instance.
+        doc_id (str): The ID of the document to write to.
+        content (str): The resume content.
+        styles (list): List of text style information.
         
+    Raises:
+        HttpError: If the Docs API request fails.
+    """
+    from googleapiclient.errors import HttpError
+
+    try:
         # Insert content
         requests = [
             {
@@ -432,8 +1142,8 @@ def create_tailored_resume(service, title, content, styles):
             }
         ]
         
-        # Apply text styles
-        for style_info in styles:
+        # Apply text styles, one request per run of identical styling
+        for style_info in merge_styles(styles):
             requests.append({
                 'updateTextStyle': {
                     'range': {
@@ -441,7 +1151,7 @@ def create_tailored_resume(service, title, content, styles):
                         'endIndex': style_info['end_index'] + 1
                     },
                     'textStyle': style_info['style'],
-                    'fields': ','.join(style_info['style'].keys())
+                    'fields': style_info['fields']
                 }
             })
         
@@ -449,10 +1159,342 @@ def create_tailored_resume(service, title, content, styles):
             documentId=doc_id,
             body={'requests': requests}
         ).execute()
+    except HttpError as e:
+        logging.error(f"Failed to write document {doc_id}: {str(e)}")
+        raise
+
+
+def create_tailored_resume(service, title, content, styles):
+    """Create a new Google Doc with the tailored resume, preserving formatting.
+    
+    Args:
+        service: The Google Docs service instance.
+        title (str): The title for the new document.
+        content (str): The resume content.
+        styles (list): List of text style information.
         
-        return doc_id
-    except Exception as e:
-        raise Exception(f"Failed to create tailored resume document: {str(e)}")
+    Returns:
+        str: The ID of the created document.
+    """
+    doc_id = create_document(service, title)
+    write_tailored_resume(service, doc_id, content, styles)
+    return doc_id
+
+
+async def run_llm_phase(docs_service, base_title, resume_content, job_content, temperature):
+    """Tailor the resume and create the output doc for it.
+    
+    When the job details can be parsed from the posting header, the empty
+    output document is created while the tailored resume streams in, so the
+    document ID is usually ready by the time the last token arrives.
+    Otherwise the job details come with the tailored resume from a single
+    completion and the document is created afterwards.
+    
+    Args:
+        docs_service: The Google Docs service instance.
+        base_title (str): The title of the base resume document.
+        resume_content (str): The original resume content.
+        job_content (str): The job posting content.
+        temperature (float): Tailoring intensity between 0.0 and 1.0
+        
+    Returns:
+        tuple: (new_title, new_doc_id, tailored_content)
+    """
+    client = get_openai_client()
+    created = {}
+
+    async def create_titled_document(company_name, job_title):
+        new_title = f"{base_title} - {company_name} - {job_title}"
+        print(f"\nCreating new document: {new_title}")
+        created['title'] = new_title
+        created['doc_id'] = await asyncio.to_thread(create_document, docs_service, new_title)
+
+    _, _, tailored_content = await get_tailored_resume(
+        client, resume_content, job_content, temperature,
+        on_details=create_titled_document, echo=True
+    )
+    return created['title'], created['doc_id'], tailored_content
+
+
+async def tailor_many(docs_service, base_title, resume_content, styles, job_files,
+                      temperature, output_dir=None, concurrency=BATCH_CONCURRENCY):
+    """Tailor the resume for several job postings concurrently.
+    
+    At most `concurrency` postings are processed at once. Google Docs calls
+    share one HTTP connection, which is not thread-safe, so they are
+    serialized; they are short compared to the model calls.
+    
+    Args:
+        docs_service: The Google Docs service instance.
+        base_title (str): The title of the base resume document.
+        resume_content (str): The original resume content.
+        styles (list): List of text style information.
+        job_files (list): Paths to job posting text files.
+        temperature (float): Tailoring intensity between 0.0 and 1.0
+        output_dir (str): Also save each tailored resume as text here.
+        concurrency (int): Maximum number of postings processed at once.
+        
+    Returns:
+        list: One (job_file, new_title or exception) tuple per job file.
+    """
+    client = get_openai_client()
+    semaphore = asyncio.Semaphore(concurrency)
+    docs_lock = asyncio.Lock()
+
+    async def tailor_one(job_file):
+        async with semaphore:
+            job_content = read_file_with_encodings(job_file)
+            company_name, job_title, tailored_content = await get_tailored_resume(
+                client, resume_content, job_content, temperature
+            )
+            new_title = f"{base_title} - {company_name} - {job_title}"
+            async with docs_lock:
+                await asyncio.to_thread(
+                    create_tailored_resume, docs_service, new_title, tailored_content, styles
+                )
+            if output_dir:
+                save_tailored_text(output_dir, new_title, tailored_content)
+            logging.info(f"Created {new_title}")
+            return new_title
+
+    results = await asyncio.gather(
+        *(tailor_one(job_file) for job_file in job_files),
+        return_exceptions=True
+    )
+    return list(zip(job_files, results))
+
+
+async def tailor_many_batch_api(docs_service, base_title, resume_content, styles,
+                                job_files, temperature, output_dir=None):
+    """Tailor the resume for several job postings through the OpenAI Batch API.
+    
+    All requests are uploaded as one JSONL batch, which costs half as much
+    as synchronous completions and has separate, larger rate limits, but
+    may take up to BATCH_COMPLETION_WINDOW to finish. The batch is polled
+    until it completes and the documents are then created one by one.
+    
+    Args:
+        docs_service: The Google Docs service instance.
+        base_title (str): The title of the base resume document.
+        resume_content (str): The original resume content.
+        styles (list): List of text style information.
+        job_files (list): Paths to job posting text files.
+        temperature (float): Tailoring intensity between 0.0 and 1.0
+        output_dir (str): Also save each tailored resume as text here.
+        
+    Returns:
+        list: One (job_file, new_title or exception) tuple per job file.
+        
+    Raises:
+        APIError: If the batch cannot be submitted or does not complete.
+    """
+    import openai
+
+    client = get_openai_client()
+    results = {}
+    known_details = {}
+    lines = []
+
+    for i, job_file in enumerate(job_files):
+        try:
+            job_content = read_file_with_encodings(job_file)
+        except (FileReadError, OSError) as e:
+            results[job_file] = e
+            continue
+
+        details = parse_job_details(job_content)
+        body = {
+            'model': MODEL_NAME,
+            'messages': build_tailoring_messages(
+                resume_content, job_content, temperature, extract_details=not details
+            )
+        }
+        if details:
+            known_details[job_file] = details
+        else:
+            body['response_format'] = TAILORED_RESUME_FORMAT
+        lines.append(json.dumps({
+            'custom_id': f"job-{i}",
+            'method': 'POST',
+            'url': '/v1/chat/completions',
+            'body': body
+        }))
+
+    if lines:
+        try:
+            batch_file = await client.files.create(
+                file=('batch.jsonl', '\n'.join(lines).encode('utf-8')),
+                purpose='batch'
+            )
+            batch = await client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint='/v1/chat/completions',
+                completion_window=BATCH_COMPLETION_WINDOW
+            )
+            # The batch keeps running if this process is interrupted, and its
+            # results can still be fetched later by ID
+            logging.info(f"Submitted batch {batch.id} with {len(lines)} requests")
+
+            while batch.status not in BATCH_TERMINAL_STATUSES:
+                await asyncio.sleep(BATCH_POLL_INTERVAL)
+                batch = await client.batches.retrieve(batch.id)
+                counts = batch.request_counts
+                progress = f" ({counts.completed}/{counts.total})" if counts else ""
+                logging.info(f"Batch {batch.id}: {batch.status}{progress}")
+
+            if batch.status != 'completed':
+                raise APIError(f"Batch {batch.id} ended with status: {batch.status}")
+
+            # Successful requests are in the output file, failed ones in the
+            # error file
+            responses = {}
+            for file_id in (batch.output_file_id, batch.error_file_id):
+                if not file_id:
+                    continue
+                output = await client.files.content(file_id)
+                for line in output.text.splitlines():
+                    if line.strip():
+                        item = json.loads(line)
+                        responses[item['custom_id']] = item
+        except openai.APIError as e:
+            raise APIError(f"Failed to run batch: {str(e)}") from e
+
+        for i, job_file in enumerate(job_files):
+            if job_file in results:
+                continue
+            item = responses.get(f"job-{i}")
+            try:
+                if not item:
+                    raise APIError(f"Batch {batch.id} returned no response for this request")
+                response = item.get('response') or {}
+                error = item.get('error') or response.get('body', {}).get('error')
+                if error or response.get('status_code') != 200:
+                    message = error.get('message') if isinstance(error, dict) else error
+                    raise APIError(f"Batch request failed: "
+                                   f"{message or 'status ' + str(response.get('status_code'))}")
+
+                content = item['response']['body']['choices'][0]['message']['content']
+                if job_file in known_details:
+                    company_name, job_title = known_details[job_file]
+                    tailored_content = content
+                else:
+                    company_name, job_title, tailored_content = parse_tailored_response(content)
+
+                new_title = f"{base_title} - {company_name} - {job_title}"
+                await asyncio.to_thread(
+                    create_tailored_resume, docs_service, new_title, tailored_content, styles
+                )
+                if output_dir:
+                    save_tailored_text(output_dir, new_title, tailored_content)
+                logging.info(f"Created {new_title}")
+                results[job_file] = new_title
+            except Exception as e:
+                results[job_file] = e
+
+    return [(job_file, results[job_file]) for job_file in job_files]
+
+
+def expand_job_files(patterns):
+    """Expand glob patterns into a sorted, de-duplicated list of job files.
+    
+    Args:
+        patterns (list): File paths or glob patterns.
+        
+    Returns:
+        list: The matching file paths.
+        
+    Raises:
+        FileReadError: If a pattern matches no files.
+    """
+    job_files = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern))
+        if not matches:
+            raise FileReadError(f"No job posting files match: {pattern}")
+        job_files.extend(match for match in matches if match not in job_files)
+    return job_files
+
+
+def save_tailored_text(output_dir, title, content):
+    """Save a plain-text copy of a tailored resume.
+    
+    Args:
+        output_dir (str): Directory to write to; created if missing.
+        title (str): The tailored document title, used as the file name.
+        content (str): The resume content.
+        
+    Returns:
+        str: The path of the written file.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, _UNSAFE_FILENAME_RE.sub('_', title).strip() + '.txt')
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(content)
+    return path
+
+
+def parse_temperature(value):
+    """Parse and validate the --temperature option.
+    
+    Args:
+        value (str): The option value.
+        
+    Returns:
+        float: Tailoring temperature between 0.0 and 1.0
+        
+    Raises:
+        argparse.ArgumentTypeError: If the value is not in range.
+    """
+    try:
+        temperature = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a number: {value}")
+    if not 0.0 <= temperature <= 1.0:
+        raise argparse.ArgumentTypeError("must be between 0.0 and 1.0")
+    return temperature
+
+
+def parse_args():
+    """Parse command line arguments.
+    
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Tailor a Google Docs resume to one or more job postings. "
+                    "Values not given as options are prompted for interactively."
+    )
+    parser.add_argument(
+        '--doc-link', metavar='URL',
+        help="Google Docs sharing link of the base resume"
+    )
+    jobs = parser.add_mutually_exclusive_group()
+    jobs.add_argument(
+        '--job-file', metavar='PATH',
+        help="Job posting text file (default: job_posting.txt if present)"
+    )
+    jobs.add_argument(
+        '--batch', nargs='+', metavar='JOB_FILE',
+        help="Tailor the resume for every job posting file given (globs allowed, e.g. 'jobs/*.txt')"
+    )
+    parser.add_argument(
+        '--temperature', type=parse_temperature, metavar='0.0-1.0',
+        help="Tailoring level, from 0.0 (minimal changes) to 1.0 (extensive changes)"
+    )
+    parser.add_argument(
+        '--output-dir', metavar='DIR',
+        help="Also save each tailored resume as a text file in this directory"
+    )
+    parser.add_argument(
+        '--batch-api', action='store_true',
+        help="With --batch, submit through the OpenAI Batch API: half the cost, "
+             "but results can take up to 24 hours (also enabled by BATCH_MODE=1)"
+    )
+    args = parser.parse_args()
+    if args.batch_api and not args.batch:
+        parser.error("--batch-api requires --batch")
+    args.batch_api = args.batch_api or os.getenv('BATCH_MODE') == '1'
+    return args
 
 
 def get_tailoring_temperature():
@@ -460,7 +1502,12 @@ def get_tailoring_temperature():
     
     Returns:
         float: Tailoring temperature between 0.0 and 1.0
+        
+    Raises:
+        ValueError: If stdin is not a terminal.
     """
+    require_interactive('--temperature')
+
     print("\nEnter tailoring level (0.0 to 1.0):")
     print("0.0: Minimal changes (preserve most of original)")
     print("0.5: Balanced changes")
@@ -482,67 +1529,89 @@ def get_tailoring_temperature():
 
 
 def main():
-    """Main execution function."""
+    """Main execution function.
+    
+    All prompts are answered before the event loop starts, so Ctrl+C at a
+    prompt exits cleanly. The base resume is fetched in a background thread
+    meanwhile, and only the OpenAI and Docs calls run under asyncio.
+    
+    Returns:
+        int: The process exit code.
+    """
+    args = parse_args()
+
     try:
         # Check environment variables
         check_environment()
 
+        job_files = expand_job_files(args.batch) if args.batch else None
+
         # Get base resume document ID
-        doc_id = get_base_resume()
+        doc_id = extract_doc_id(args.doc_link) if args.doc_link else get_base_resume()
 
-        # Initialize Google Docs service with retry on token error
-        max_retries = 2
-        for attempt in range(max_retries):
-            try:
-                creds = get_google_auth()
-                docs_service = build('docs', 'v1', credentials=creds)
-                # Test the credentials with a simple API call
-                docs_service.documents().get(documentId=doc_id).execute()
-                break  # If we get here, the credentials work
-            except Exception as e:
-                if 'invalid_grant' in str(e) and attempt < max_retries - 1:
-                    logging.warning("Token validation failed, retrying authentication...")
-                    if os.path.exists('token.pickle'):
-                        os.remove('token.pickle')
-                    continue
-                raise  # Re-raise the exception if we're out of retries or it's a different error
+        # Authenticate now, since the OAuth flow may need the browser, then
+        # fetch the resume in the background while the user answers prompts
+        docs_service = build_docs_service(get_google_auth())
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        fetch_future = executor.submit(fetch_document, docs_service, doc_id)
+        executor.shutdown(wait=False)
+
+        # Get job posting
+        job_content = None
+        if args.job_file:
+            job_content = read_file_with_encodings(args.job_file)
+        elif not job_files:
+            print("\nNext, let's get the job posting details.")
+            job_content = get_job_posting()
+
+        # Get tailoring temperature
+        temperature = args.temperature
+        if temperature is None:
+            temperature = get_tailoring_temperature()
 
         # Read content from Google Doc
         logging.info("Reading resume content...")
-        resume_content, styles = read_doc(docs_service, doc_id)
+        docs_service, document = wait_for_document(fetch_future, docs_service, doc_id)
+        base_title, resume_content, styles = read_doc(document)
 
-        # Get job posting
-        print("\nNext, let's get the job posting details.")
-        job_content = get_job_posting()
+        if job_files:
+            print(f"\nTailoring resume for {len(job_files)} job postings...")
+            run_batch = tailor_many_batch_api if args.batch_api else tailor_many
+            results = asyncio.run(run_batch(
+                docs_service, base_title, resume_content, styles, job_files, temperature,
+                output_dir=args.output_dir
+            ))
+            failures = 0
+            for job_file, result in results:
+                if isinstance(result, Exception):
+                    failures += 1
+                    print(f"  {job_file}: Error: {str(result)}")
+                else:
+                    print(f"  {job_file}: {result}")
+            print(f"\n{len(results) - failures} of {len(results)} tailored resumes saved to Google Drive.")
+            return 1 if failures else 0
 
-        # Extract job details
-        print("\nExtracting job details...")
-        company_name, job_title = extract_job_details(client, job_content)
-        
-        # Get base resume title
-        base_title = get_base_doc_title(docs_service, doc_id)
-        
-        # Get tailoring temperature
-        temperature = get_tailoring_temperature()
-        
-        # Generate tailored resume
+        # Tailor the resume; job details and the new document are handled
+        # concurrently since they only depend on inputs we already have
         print("\nTailoring resume for the position...")
-        tailored_content = tailor_resume(client, resume_content, job_content, temperature)
+        new_title, new_doc_id, tailored_content = asyncio.run(run_llm_phase(
+            docs_service, base_title, resume_content, job_content, temperature
+        ))
         
-        # Create new document
-        new_title = f"{base_title} - {company_name} - {job_title}"
-        print(f"\nCreating new document: {new_title}")
-        new_doc_id = create_tailored_resume(docs_service, new_title, tailored_content, styles)
+        # Fill in the new document
+        write_tailored_resume(docs_service, new_doc_id, tailored_content, styles)
+        if args.output_dir:
+            path = save_tailored_text(args.output_dir, new_title, tailored_content)
+            print(f"\nSaved a text copy to {path}")
         
         print(f"\nTailored resume saved to new document. You can find it in your Google Drive.")
         print(f"Document title: {new_title}")
+        return 0
 
     except Exception as e:
         print(f"\nError: {str(e)}")
         return 1
 
-    return 0
-
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""Exact and embedding-based response caches for OpenAI completions."""
+
+import hashlib
+import json
+import logging
+import math
+import os
+from typing import Any, List, Optional, Tuple
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'resume-tailor')
+DEFAULT_CACHE_PATH = os.path.join(CACHE_DIR, 'semantic_cache.json')
+
+
+def cosine_similarity(a: List[float], b: List[float]) -> float:
+    """Return the cosine similarity of two vectors.
+
+    Args:
+        a: The first vector.
+        b: The second vector.
+
+    Returns:
+        The cosine similarity, or 0.0 if either vector is all zeros.
+    """
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+def write_json_atomic(path: str, value: Any):
+    """Write a JSON file via a temporary file so readers never see partial data.
+
+    Args:
+        path: Destination file path.
+        value: A JSON-serializable value.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+        json.dump(value, cache_file)
+    os.replace(tmp_path, path)
+
+
+class ExactCache:
+    """Cache of LLM responses keyed by a hash of the exact request inputs.
+
+    Each response is stored in its own JSON file named after the BLAKE2b
+    digest of the inputs, so a lookup is a single file read.
+    """
+
+    def __init__(self, directory: str = CACHE_DIR):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding the cached responses.
+        """
+        self.directory = directory
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        """Return the cache key for a request.
+
+        Args:
+            *parts: Everything the response depends on (model, prompt, ...).
+
+        Returns:
+            The hex digest identifying the request.
+        """
+        data = '\x00'.join(parts).encode('utf-8')
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for a key, or None on a miss.
+
+        Args:
+            key: A key returned by ExactCache.key.
+        """
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as cache_file:
+                response = json.load(cache_file)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable cache {path}: {str(e)}")
+            return None
+        logging.info("Exact cache hit")
+        return response
+
+    def set(self, key: str, response: Any):
+        """Store a response under a key.
+
+        Args:
+            key: A key returned by ExactCache.key.
+            response: A JSON-serializable response.
+        """
+        try:
+            write_json_atomic(self._path(key), response)
+        except OSError as e:
+            logging.warning(f"Failed to write cache {self._path(key)}: {str(e)}")
+
+
+class SemanticCache:
+    """Cache of LLM responses keyed by an embedding of the request inputs.
+
+    Entries are grouped by namespace so that unrelated prompts (or the same
+    prompt at a different tailoring level) never match each other. Within a
+    namespace the most similar entry is returned when its cosine similarity
+    reaches the caller's threshold.
+    """
+
+    def __init__(self, client, path: str = DEFAULT_CACHE_PATH):
+        """Initialize the cache.
+
+        Args:
+            client: The async OpenAI client used to compute embeddings.
+            path: Location of the JSON file backing the cache.
+        """
+        self.client = client
+        self.path = path
+        self._entries = None
+
+    def _load(self) -> List[dict]:
+        """Load cache entries from disk on first use."""
+        if self._entries is None:
+            self._entries = []
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as cache_file:
+                        self._entries = json.load(cache_file)
+                except (OSError, ValueError) as e:
+                    logging.warning(f"Ignoring unreadable cache {self.path}: {str(e)}")
+        return self._entries
+
+    def _save(self):
+        """Write cache entries to disk atomically."""
+        write_json_atomic(self.path, self._entries)
+
+    async def embed(self, text: str) -> List[float]:
+        """Compute the embedding of a cache key.
+
+        Args:
+            text: The composite key text.
+
+        Returns:
+            The embedding vector.
+        """
+        response = await self.client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+        return response.data[0].embedding
+
+    async def lookup(self, namespace: str, key_text: str,
+                     threshold: float) -> Tuple[Optional[Any], List[float]]:
+        """Find the cached response most similar to the given key.
+
+        Args:
+            namespace: The entry group to search.
+            key_text: The composite key text.
+            threshold: Minimum cosine similarity for a hit.
+
+        Returns:
+            A tuple of (cached response or None, key embedding). The embedding
+            is returned so a miss can be stored without embedding twice.
+        """
+        embedding = await self.embed(key_text)
+        best_score = 0.0
+        best_response = None
+        for entry in self._load():
+            if entry['namespace'] != namespace:
+                continue
+            score = cosine_similarity(embedding, entry['embedding'])
+            if score > best_score:
+                best_score, best_response = score, entry['response']
+
+        if best_score >= threshold:
+            logging.info(f"Semantic cache hit for {namespace} (similarity {best_score:.3f})")
+            return best_response, embedding
+        return None, embedding
+
+    def store(self, namespace: str, embedding: List[float], response: Any):
+        """Add a response to the cache and persist it.
+
+        Args:
+            namespace: The entry group to store under.
+            embedding: The key embedding returned by lookup.
+            response: A JSON-serializable response.
+        """
+        self._load().append({
+            'namespace': namespace,
+            'embedding': embedding,
+            'response': response
+        })
+        try:
+            self._save()
+        except OSError as e:
+            logging.warning(f"Failed to write cache {self.path}: {str(e)}")